@@ -1,4 +1,4 @@
-from flask import Flask, jsonify, request, send_from_directory, g
+from flask import Flask, Response, jsonify, request, send_from_directory, g
 from flask_cors import CORS
 from flask_swagger_ui import get_swaggerui_blueprint
 import os
@@ -25,7 +25,7 @@ from routes.interface_routes import create_interface_routes
 from routes.peer_routes import create_peer_routes
 from routes.config_routes import create_config_routes
 from routes.state_routes import create_state_routes
-from swagger.spec import get_swagger_spec
+from swagger.spec import get_swagger_spec_json, get_swagger_spec_etag
 
 config = AppConfig()
 
@@ -157,7 +157,10 @@ def inject_command_logs(response):
 @app.route('/api/swagger.json', methods=['GET'])
 def swagger_spec():
     """Serve the OpenAPI specification."""
-    return jsonify(get_swagger_spec(app))
+    response = Response(get_swagger_spec_json(app), mimetype='application/json')
+    # Let the Swagger UI revalidate with If-None-Match instead of re-downloading
+    response.set_etag(get_swagger_spec_etag(app))
+    return response.make_conditional(request)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -83,6 +83,8 @@ fi
 # Create installation directory
 echo -e "${YELLOW}Creating installation directory: $INSTALL_DIR${NC}"
 mkdir -p "$INSTALL_DIR"
+# Any previous install marker no longer describes the code being copied
+rm -f "$INSTALL_DIR/.installed"
 cp -r . "$INSTALL_DIR/"
 cd "$INSTALL_DIR"
 
@@ -16,10 +16,7 @@ def create_config_routes(config_service: ConfigService):
           summary: Sync config
           description: Generate final config file from interface folder structure
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           responses:
             200:
               description: Config synchronized successfully
@@ -53,10 +50,7 @@ def create_config_routes(config_service: ConfigService):
           summary: Apply config
           description: Generate config AND apply it to running state (syncconf/up)
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           responses:
             200:
               description: Config applied successfully
@@ -97,10 +91,7 @@ def create_config_routes(config_service: ConfigService):
           summary: Reset config
           description: Generate interface folder from final config file
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           responses:
             200:
               description: Config reset successfully
@@ -133,10 +124,7 @@ def create_config_routes(config_service: ConfigService):
           summary: Get config diff
           description: Get structured diff between folder structure and current conf file
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           responses:
             200:
               description: Config diff with structured data
@@ -95,11 +95,7 @@ def create_interface_routes(interface_service: InterfaceService, host_info_servi
           summary: Get interface details
           description: Get details of a specific interface
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
-              description: Interface name (e.g., wg0)
+            - interface
           responses:
             200:
               description: Interface details
@@ -124,10 +120,7 @@ def create_interface_routes(interface_service: InterfaceService, host_info_servi
           summary: Update interface
           description: Update an existing interface
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           requestBody:
             required: true
             content:
@@ -170,10 +163,7 @@ def create_interface_routes(interface_service: InterfaceService, host_info_servi
           summary: Delete interface
           description: Delete an existing interface
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           responses:
             200:
               description: Interface deleted successfully
@@ -16,11 +16,7 @@ def create_peer_routes(peer_service: PeerService):
           summary: List peers
           description: Get all peers for an interface
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
-              description: Interface name
+            - interface
           responses:
             200:
               description: List of peers
@@ -50,10 +46,7 @@ def create_peer_routes(peer_service: PeerService):
           summary: Add peer
           description: Add a new peer to an interface
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           requestBody:
             required: true
             content:
@@ -106,14 +99,8 @@ def create_peer_routes(peer_service: PeerService):
           summary: Get peer details
           description: Get details of a specific peer
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
-            - name: peer_name
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
+            - peer_name
           responses:
             200:
               description: Peer details
@@ -143,14 +130,8 @@ def create_peer_routes(peer_service: PeerService):
           summary: Update peer
           description: Update an existing peer
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
-            - name: peer_name
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
+            - peer_name
           requestBody:
             required: true
             content:
@@ -198,14 +179,8 @@ def create_peer_routes(peer_service: PeerService):
           summary: Delete peer
           description: Delete an existing peer
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
-            - name: peer_name
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
+            - peer_name
           responses:
             200:
               description: Peer deleted successfully
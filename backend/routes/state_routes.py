@@ -16,10 +16,7 @@ def create_state_routes(state_service: StateService):
           summary: Get interface state
           description: Get current state of interface from wg show command
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           responses:
             200:
               description: Interface state
@@ -39,10 +36,7 @@ def create_state_routes(state_service: StateService):
           summary: Get state diff
           description: Get diff between wg show output and current conf file
           parameters:
-            - name: interface
-              in: path
-              required: true
-              schema: {"type": "string"}
+            - interface
           responses:
             200:
               description: State diff
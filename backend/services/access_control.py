@@ -1,10 +1,52 @@
 import logging
 import ipaddress
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from flask import Request
 
 logger = logging.getLogger(__name__)
 
+# Longer than any textual IPv6 address with a scope id; client-supplied strings
+# beyond this are rejected before they can take a slot in the parse cache
+_MAX_IP_LEN = 64
+
+
+@lru_cache(maxsize=4096)
+def _parse_ip(ip_str: str) -> Optional[Tuple[int, int, Optional[int]]]:
+    """Parse an address string into (version, address as int, embedded IPv4 as int).
+
+    The last item is set only for IPv4-mapped IPv6 addresses (::ffff:a.b.c.d).
+    Memoized since the same clients hit every request.
+    """
+    try:
+        ip = ipaddress.ip_address(ip_str)
+    except ValueError:
+        return None
+    mapped = ip.ipv4_mapped if ip.version == 6 else None
+    return ip.version, int(ip), int(mapped) if mapped is not None else None
+
+
+class _NetworkTable(list):
+    """List of compiled networks with a per-prefix-length hash index for lookups.
+
+    Membership costs one mask and one set lookup per distinct prefix length of the
+    address's IP version, instead of a containment test against every network.
+    """
+
+    def __init__(self, nets=()):
+        super().__init__(nets)
+        # version -> [(netmask as int, {network address as int})]
+        by_mask = {4: {}, 6: {}}
+        for n in self:
+            by_mask[n.version].setdefault(int(n.netmask), set()).add(int(n.network_address))
+        self._index = {version: list(masks.items()) for version, masks in by_mask.items()}
+
+    def contains(self, version: int, ip_int: int) -> bool:
+        for mask, addrs in self._index[version]:
+            if ip_int & mask in addrs:
+                return True
+        return False
+
 
 class AccessControl:
     def __init__(self, allowed_proxies: List[str], allowed_ips: List[str]):
@@ -12,7 +54,7 @@ class AccessControl:
         self.allowed_proxies = self._compile_nets(allowed_proxies)
         self.allowed_ips = self._compile_nets(allowed_ips)
 
-    def _compile_nets(self, entries: List[str]) -> List[ipaddress._BaseNetwork]:
+    def _compile_nets(self, entries: List[str]) -> _NetworkTable:
         nets = []
         for e in entries:
             e = e.strip()
@@ -33,25 +75,23 @@ class AccessControl:
             except ValueError:
                 # Ignore invalid entries; validation occurs at startup
                 continue
-        return nets
+        return _NetworkTable(nets)
 
-    def _ip_in_nets(self, ip_str: str, nets: List[ipaddress._BaseNetwork]) -> bool:
-        try:
-            ip = ipaddress.ip_address(ip_str)
-        except ValueError:
+    def _ip_in_nets(self, ip_str: str, nets: _NetworkTable) -> bool:
+        if len(ip_str) > _MAX_IP_LEN:
+            return False
+        parsed = _parse_ip(ip_str)
+        if parsed is None:
             return False
+        version, ip_int, mapped_int = parsed
         
         # Check original IP
-        for n in nets:
-            if ip in n:
-                return True
+        if nets.contains(version, ip_int):
+            return True
         
         # Check IPv4-mapped IPv6 address (e.g. ::ffff:192.168.1.1)
-        if ip.version == 6 and ip.ipv4_mapped:
-            mapped = ip.ipv4_mapped
-            for n in nets:
-                if mapped in n:
-                    return True
+        if mapped_int is not None:
+            return nets.contains(4, mapped_int)
 
         return False
 
@@ -1,18 +1,11 @@
 from apispec import APISpec
 from apispec_webframeworks.flask import FlaskPlugin
+import hashlib
 import json
 
-def get_swagger_spec(app=None):
-    """Generate OpenAPI 3.0 specification."""
-    spec = APISpec(
-        title="WireGuard Manager API",
-        version="1.0.0",
-        openapi_version="3.0.0",
-        plugins=[FlaskPlugin()],
-    )
-
-    # Define components/schemas
-    spec.components.schema("CommandLog", {
+# Component schemas registered on every generated spec, keyed by schema name
+_SCHEMAS = {
+    "CommandLog": {
         "type": "object",
         "properties": {
             "command": {"type": "string"},
@@ -20,9 +13,18 @@ def get_swagger_spec(app=None):
             "stdout": {"type": "string"},
             "stderr": {"type": "string"}
         }
-    })
+    },
+
+    "CommandLogs": {
+        "type": "array",
+        "items": {"$ref": "#/components/schemas/CommandLog"}
+    },
+
+    "AllowedIPs": {"type": "string", "example": "10.0.0.2/32"},
+
+    "Endpoint": {"type": "string", "example": "203.0.113.1:51820"},
 
-    spec.components.schema("Interface", {
+    "Interface": {
         "type": "object",
         "properties": {
             "name": {"type": "string", "example": "wg0"},
@@ -31,14 +33,11 @@ def get_swagger_spec(app=None):
             "private_key": {"type": "string", "example": "cGhpcHBMVGtOU3h..."},
             "public_key": {"type": "string", "example": "MTVHVGtOU3hwaGl..."},
             "warnings": {"type": "string"},
-            "commands": {
-                "type": "array",
-                "items": {"$ref": "#/components/schemas/CommandLog"}
-            }
+            "commands": {"$ref": "#/components/schemas/CommandLogs"}
         }
-    })
+    },
 
-    spec.components.schema("InterfaceCreate", {
+    "InterfaceCreate": {
         "type": "object",
         "required": ["name"],
         "properties": {
@@ -46,17 +45,17 @@ def get_swagger_spec(app=None):
             "address": {"type": "string", "example": "10.0.0.1/24"},
             "listen_port": {"type": "string", "example": "51820"}
         }
-    })
+    },
 
-    spec.components.schema("InterfaceUpdate", {
+    "InterfaceUpdate": {
         "type": "object",
         "properties": {
             "address": {"type": "string", "example": "10.0.0.1/24"},
             "listen_port": {"type": "string", "example": "51820"}
         }
-    })
+    },
 
-    spec.components.schema("PeerState", {
+    "PeerState": {
         "type": "object",
         "properties": {
             "public_key": {"type": "string"},
@@ -67,9 +66,9 @@ def get_swagger_spec(app=None):
             "transfer_tx": {"type": "integer"},
             "persistent_keepalive": {"type": "string"}
         }
-    })
+    },
 
-    spec.components.schema("InterfaceState", {
+    "InterfaceState": {
         "type": "object",
         "properties": {
             "interface": {"type": "string", "example": "wg0"},
@@ -82,83 +81,140 @@ def get_swagger_spec(app=None):
                 "items": {"$ref": "#/components/schemas/PeerState"}
             },
             "warnings": {"type": "string"},
-            "commands": {
-                "type": "array",
-                "items": {"$ref": "#/components/schemas/CommandLog"}
-            }
+            "commands": {"$ref": "#/components/schemas/CommandLogs"}
         }
-    })
+    },
 
-    spec.components.schema("DiffResponse", {
+    "DiffResponse": {
         "type": "object",
         "properties": {
             "diff": {"type": "string"},
             "status": {"type": "string", "enum": ["success", "inactive", "not_found", "error"]},
             "message": {"type": "string"},
             "warnings": {"type": "string"},
-            "commands": {
-                "type": "array",
-                "items": {"$ref": "#/components/schemas/CommandLog"}
-            }
+            "commands": {"$ref": "#/components/schemas/CommandLogs"}
         }
-    })
+    },
 
-    spec.components.schema("Peer", {
+    "Peer": {
         "type": "object",
         "properties": {
             "name": {"type": "string", "example": "client1"},
             "public_key": {"type": "string"},
             "private_key": {"type": "string"},
-            "allowed_ips": {"type": "string", "example": "10.0.0.2/32"},
-            "endpoint": {"type": "string", "example": "203.0.113.1:51820"},
+            "allowed_ips": {"$ref": "#/components/schemas/AllowedIPs"},
+            "endpoint": {"$ref": "#/components/schemas/Endpoint"},
             "persistent_keepalive": {"type": "string", "example": "25"},
             "warnings": {"type": "string"},
-            "commands": {
-                "type": "array",
-                "items": {"$ref": "#/components/schemas/CommandLog"}
-            }
+            "commands": {"$ref": "#/components/schemas/CommandLogs"}
         }
-    })
+    },
 
-    spec.components.schema("PeerCreate", {
+    "PeerCreate": {
         "type": "object",
         "required": ["name"],
         "properties": {
             "name": {"type": "string", "example": "client1"},
-            "allowed_ips": {"type": "string", "example": "10.0.0.2/32"},
-            "endpoint": {"type": "string", "example": "203.0.113.1:51820"},
+            "allowed_ips": {"$ref": "#/components/schemas/AllowedIPs"},
+            "endpoint": {"$ref": "#/components/schemas/Endpoint"},
             "persistent_keepalive": {"type": "string", "example": "25"}
         }
-    })
+    },
 
-    spec.components.schema("PeerUpdate", {
+    "PeerUpdate": {
         "type": "object",
         "properties": {
-            "allowed_ips": {"type": "string", "example": "10.0.0.2/32"},
-            "endpoint": {"type": "string", "example": "203.0.113.1:51820"},
+            "allowed_ips": {"$ref": "#/components/schemas/AllowedIPs"},
+            "endpoint": {"$ref": "#/components/schemas/Endpoint"},
             "persistent_keepalive": {"type": "string", "example": "25"}
         }
-    })
+    },
 
-    spec.components.schema("Error", {
+    "Error": {
         "type": "object",
         "properties": {
             "error": {"type": "string", "example": "Interface not found"},
             "type": {"type": "string", "example": "InterfaceNotFoundException"},
             "details": {"type": "string"}
         }
+    }
+}
+
+# Routes included in the spec: every endpoint of these blueprints, plus standalone app endpoints
+_DOCUMENTED_BLUEPRINTS = frozenset({'interfaces', 'peers', 'config', 'state'})
+_DOCUMENTED_ENDPOINTS = frozenset({'health_check'})
+
+# Per app id: (routes fingerprint, spec dict, spec JSON bytes, ETag of the bytes)
+_spec_cache = {}
+
+
+def _routes_fingerprint(app):
+    """Hash of the app's URL rules, used to notice routes registered after the spec was built."""
+    if app is None:
+        return None
+    return hash(tuple(sorted((rule.rule, rule.endpoint) for rule in app.url_map.iter_rules())))
+
+
+def _cached_spec(app):
+    fingerprint = _routes_fingerprint(app)
+    cached = _spec_cache.get(id(app))
+    if cached is None or cached[0] != fingerprint:
+        spec = _build_swagger_spec(app)
+        body = json.dumps(spec, separators=(',', ':')).encode('utf-8')
+        etag = hashlib.sha1(body).hexdigest()
+        cached = _spec_cache[id(app)] = (fingerprint, spec, body, etag)
+    return cached
+
+
+def get_swagger_spec(app=None):
+    """Return the OpenAPI 3.0 specification, generating it once per app.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    return _cached_spec(app)[1]
+
+
+def get_swagger_spec_json(app=None) -> bytes:
+    """Return the OpenAPI specification serialized as UTF-8 JSON, encoded once per app."""
+    return _cached_spec(app)[2]
+
+
+def get_swagger_spec_etag(app=None) -> str:
+    """Return the ETag of the serialized specification, hashed once per app."""
+    return _cached_spec(app)[3]
+
+
+def _build_swagger_spec(app=None):
+    """Generate OpenAPI 3.0 specification."""
+    spec = APISpec(
+        title="WireGuard Manager API",
+        version="1.0.0",
+        openapi_version="3.0.0",
+        plugins=[FlaskPlugin()],
+    )
+
+    # Shared path parameters, referenced by name from the route docstrings
+    spec.components.parameter("interface", "path", {
+        "description": "Interface name",
+        "schema": {"type": "string"}
+    })
+
+    spec.components.parameter("peer_name", "path", {
+        "description": "Peer name",
+        "schema": {"type": "string"}
     })
 
+    # Define components/schemas
+    for name, schema in _SCHEMAS.items():
+        spec.components.schema(name, schema)
+
     # Register paths from the app
     if app:
         with app.test_request_context():
             # Extract all endpoints
             for rule in app.url_map.iter_rules():
-                if rule.endpoint.startswith('interfaces.') or \
-                   rule.endpoint.startswith('peers.') or \
-                   rule.endpoint.startswith('config.') or \
-                   rule.endpoint.startswith('state.') or \
-                   rule.endpoint == 'health_check':
+                blueprint, _, _ = rule.endpoint.partition('.')
+                if blueprint in _DOCUMENTED_BLUEPRINTS or rule.endpoint in _DOCUMENTED_ENDPOINTS:
                     spec.path(view=app.view_functions[rule.endpoint])
 
     return spec.to_dict()
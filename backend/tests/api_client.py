@@ -1,17 +1,39 @@
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 
 class APIClient:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
         self.base_url = base_url.rstrip('/')
+        self._interfaces_url = f"{self.base_url}/api/interfaces"
+        self._host_info_url = f"{self.base_url}/api/host/info"
+        # A session passed in is shared with the caller, who is responsible for closing it
+        self._owns_session = session is None
+        if session is None:
+            # Reuse keep-alive connections across calls instead of reconnecting per request
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> 'APIClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def get_health(self) -> Dict[str, Any]:
-        response = requests.get(f"{self.base_url}/api/health")
+        response = self.session.get(f"{self.base_url}/api/health")
         response.raise_for_status()
         return response.json()
 
     def list_interfaces(self) -> Dict[str, Any]:
-        response = requests.get(f"{self.base_url}/api/interfaces")
+        response = self.session.get(self._interfaces_url)
         response.raise_for_status()
         return response.json()
 
@@ -21,7 +43,7 @@ class APIClient:
             "address": address,
             "listen_port": listen_port
         }
-        response = requests.post(f"{self.base_url}/api/interfaces", json=data)
+        response = self.session.post(self._interfaces_url, json=data)
         if response.status_code != 201:
              # Allow tests to handle error status codes if needed, or raise for unexpected ones
              # But for helper usage, we usually want to know if it failed. 
@@ -34,7 +56,7 @@ class APIClient:
         return response
 
     def get_interface(self, name: str) -> requests.Response:
-        return requests.get(f"{self.base_url}/api/interfaces/{name}")
+        return self.session.get(f"{self._interfaces_url}/{name}")
 
     def update_interface(self, name: str, address: Optional[str] = None, listen_port: Optional[str] = None) -> requests.Response:
         data = {}
@@ -42,14 +64,14 @@ class APIClient:
             data['address'] = address
         if listen_port:
             data['listen_port'] = listen_port
-        return requests.put(f"{self.base_url}/api/interfaces/{name}", json=data)
+        return self.session.put(f"{self._interfaces_url}/{name}", json=data)
 
     def delete_interface(self, name: str) -> requests.Response:
-        return requests.delete(f"{self.base_url}/api/interfaces/{name}")
+        return self.session.delete(f"{self._interfaces_url}/{name}")
 
     # Peer Management
     def list_peers(self, interface: str) -> requests.Response:
-        return requests.get(f"{self.base_url}/api/interfaces/{interface}/peers")
+        return self.session.get(f"{self._interfaces_url}/{interface}/peers")
 
     def add_peer(self, interface: str, name: str, allowed_ips: str = '10.0.0.2/32', endpoint: str = '', public_key: str = None) -> requests.Response:
         data = {
@@ -59,10 +81,10 @@ class APIClient:
         }
         if public_key:
             data['public_key'] = public_key
-        return requests.post(f"{self.base_url}/api/interfaces/{interface}/peers", json=data)
+        return self.session.post(f"{self._interfaces_url}/{interface}/peers", json=data)
 
     def get_peer(self, interface: str, peer_name: str) -> requests.Response:
-        return requests.get(f"{self.base_url}/api/interfaces/{interface}/peers/{peer_name}")
+        return self.session.get(f"{self._interfaces_url}/{interface}/peers/{peer_name}")
 
     def update_peer(self, interface: str, peer_name: str, allowed_ips: Optional[str] = None, endpoint: Optional[str] = None, name: Optional[str] = None, public_key: Optional[str] = None) -> requests.Response:
         data = {}
@@ -74,34 +96,34 @@ class APIClient:
             data['name'] = name
         if public_key is not None:
             data['public_key'] = public_key
-        return requests.put(f"{self.base_url}/api/interfaces/{interface}/peers/{peer_name}", json=data)
+        return self.session.put(f"{self._interfaces_url}/{interface}/peers/{peer_name}", json=data)
 
     def delete_peer(self, interface: str, peer_name: str) -> requests.Response:
-        return requests.delete(f"{self.base_url}/api/interfaces/{interface}/peers/{peer_name}")
+        return self.session.delete(f"{self._interfaces_url}/{interface}/peers/{peer_name}")
 
     # Config Management
     def sync_config(self, interface: str) -> requests.Response:
-        return requests.post(f"{self.base_url}/api/interfaces/{interface}/config/sync")
+        return self.session.post(f"{self._interfaces_url}/{interface}/config/sync")
 
     def apply_config(self, interface: str) -> requests.Response:
-        return requests.post(f"{self.base_url}/api/interfaces/{interface}/config/apply")
+        return self.session.post(f"{self._interfaces_url}/{interface}/config/apply")
 
     def reset_config(self, interface: str) -> requests.Response:
-        return requests.post(f"{self.base_url}/api/interfaces/{interface}/config/reset")
+        return self.session.post(f"{self._interfaces_url}/{interface}/config/reset")
 
     def get_config_diff(self, interface: str) -> requests.Response:
-        return requests.get(f"{self.base_url}/api/interfaces/{interface}/config/diff")
+        return self.session.get(f"{self._interfaces_url}/{interface}/config/diff")
 
     # State Management
     def get_state(self, interface: str) -> requests.Response:
-        return requests.get(f"{self.base_url}/api/interfaces/{interface}/state")
+        return self.session.get(f"{self._interfaces_url}/{interface}/state")
 
     def get_state_diff(self, interface: str) -> requests.Response:
-        return requests.get(f"{self.base_url}/api/interfaces/{interface}/state/diff")
+        return self.session.get(f"{self._interfaces_url}/{interface}/state/diff")
 
     # Host Info
     def update_host_info(self, ips: list) -> requests.Response:
-        return requests.post(f"{self.base_url}/api/host/info", json={"ips": ips})
+        return self.session.post(self._host_info_url, json={"ips": ips})
 
     def rescan_host_info(self) -> requests.Response:
-        return requests.post(f"{self.base_url}/api/host/info/rescan")
+        return self.session.post(f"{self._host_info_url}/rescan")
@@ -2,17 +2,36 @@ import pytest
 import docker
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import uuid
+import functools
+import itertools
+import codecs
 import subprocess
 import sys
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from filelock import FileLock
 from urllib.parse import urlparse
+from pathlib import Path
 from api_client import APIClient
 
+# One keep-alive pool shared by the readiness probe and the API clients, so the
+# connection opened while waiting for the backend is reused by the tests
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
 # Configuration
 IMAGE_NAME_STANDARD = "wireguard-backend-standard"
 IMAGE_NAME_SYSTEMD = "wireguard-backend-systemd"
 
+# Container mode -> (image tag, Dockerfile relative to the backend directory)
+DOCKER_IMAGES = {
+    "standard": (f"{IMAGE_NAME_STANDARD}:latest", "Dockerfile"),
+    "systemd": (f"{IMAGE_NAME_SYSTEMD}:latest", "tests/Dockerfile.systemd"),
+}
+
 # Pytest hook to show response body on assertion failures
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -45,10 +64,19 @@ def pytest_runtest_makereport(item, call):
             except Exception:
                 pass  # Don't fail the test if we can't add extra info
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "need_host_scan: rediscovers host IPs, including external lookups; skipped in CI unless RUN_HOST_SCAN is set",
+    )
+
 def pytest_addoption(parser):
     parser.addoption("--host", action="store_true", help="Run tests against host backend")
+    parser.addoption("--reuse-container", action="store_true",
+                     help="Keep the docker test containers running between sessions and reuse them (single process only)")
 
 
+@functools.cache
 def get_docker_host():
     docker_host_env = os.environ.get('DOCKER_HOST')
     if not docker_host_env:
@@ -65,85 +93,96 @@ def get_docker_host():
 def docker_client():
     return docker.from_env()
 
-@pytest.fixture(scope="session")
-def docker_stack(request, docker_client):
-    mode = request.param
-    base_url = "http://localhost:5000"
-    
-    if mode == "host-systemd":
-        print(f"\nRunning in HOST SYSTEMD mode.")
-        backend_dir = os.path.join(os.path.dirname(__file__), "..")
-        install_script = os.path.join(backend_dir, "install.sh")
-        
-        print(f"Running installation script: {install_script}")
-        try:
-            subprocess.run(["bash", "-e", install_script], check=True, cwd=backend_dir)
-            print("Installation complete. Restarting service...")
-            subprocess.run([ "systemctl", "restart", "wireguard-manager"], check=True)
-        except subprocess.CalledProcessError as e:
-            pytest.fail(f"Failed to setup host systemd: {e}")
-        
-        try:
-            wait_for_ready(base_url, mode)
-            yield base_url
-        finally:
-            print("Stopping host systemd service...")
-            subprocess.run([ "systemctl", "stop", "wireguard-manager"], check=True)
-        return
+def build_image(docker_client, mode):
+    """Build the Docker image for a container mode and return its tag."""
+    image_tag, dockerfile = DOCKER_IMAGES[mode]
 
-    if mode == "host-standard":
-        print(f"\nRunning in HOST STANDARD mode.")
-        # Ensure systemd service is stopped to avoid port conflict
-        subprocess.run([ "systemctl", "stop", "wireguard-manager"], check=False)
-        
-        backend_dir = os.path.join(os.path.dirname(__file__), "..")
-        app_path = os.path.join(backend_dir, "app.py")
-        python_exe = sys.executable
-        
-        print(f"Starting backend: {python_exe} {app_path}")
-        process = subprocess.Popen([ python_exe, app_path], cwd=backend_dir)
-        
-        try:
-            wait_for_ready(base_url, mode)
-            yield base_url
-        finally:
-            print(f"Stopping host-standard backend (PID: {process.pid})...")
-            subprocess.run([ "kill", str(process.pid)])
-            process.wait()
-        return
-
-    # Docker modes
-    image_tag = f"{IMAGE_NAME_STANDARD}:latest" if mode == "standard" else f"{IMAGE_NAME_SYSTEMD}:latest"
-    dockerfile = "Dockerfile" if mode == "standard" else "tests/Dockerfile.systemd"
-    
     in_ci = os.environ.get("GITHUB_ACTIONS", "false").lower() == "true"
     force_build = os.environ.get("WG_TEST_FORCE_BUILD", "false").lower() == "true"
-    
-    image_exists = False
+
     if in_ci and not force_build:
         try:
             docker_client.images.get(image_tag)
             print(f"\nUsing pre-existing Docker image {image_tag}")
-            image_exists = True
+            return image_tag
         except docker.errors.ImageNotFound:
             pass
 
-    if not image_exists:
-        print(f"\nBuilding {mode} Docker image {image_tag}...")
-        image, logs = docker_client.images.build(
-            path=os.path.join(os.path.dirname(__file__), ".."),
-            dockerfile=dockerfile,
-            tag=image_tag,
-            nocache=False,
-            rm=True
-        )
-        for log in logs:
-            if 'stream' in log:
-                print(log['stream'].strip())
+    print(f"\nBuilding {mode} Docker image {image_tag}...")
+    image, logs = docker_client.images.build(
+        path=os.path.join(os.path.dirname(__file__), ".."),
+        dockerfile=dockerfile,
+        tag=image_tag,
+        nocache=False,
+        # Seed the layer cache from the previous images of both modes, e.g. ones loaded
+        # by buildx in CI; the two Dockerfiles share their base and dependency layers
+        cache_from=[tag for tag, _ in DOCKER_IMAGES.values()],
+        rm=True
+    )
+    for log in logs:
+        if 'stream' in log:
+            print(log['stream'].strip())
+    return image_tag
 
-    container_name = f"wg-test-{mode}-{uuid.uuid4().hex[:8]}"
-    print(f"Starting {mode} container {container_name}...")
-    
+@pytest.fixture(scope="session")
+def docker_images(docker_client, tmp_path_factory):
+    """Build the images for all container modes once, concurrently.
+
+    Under pytest-xdist the lock lives in the temp root shared by the workers of
+    this run, so only the first worker builds and the others pick up the tags it
+    recorded. Without xdist that directory outlives the run, so always build.
+    """
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        return _build_images(docker_client, list(DOCKER_IMAGES))
+
+    shared_dir = tmp_path_factory.getbasetemp().parent
+    with FileLock(str(shared_dir / "wg-test-images.lock")):
+        # Tag files mark images already built in this run, so later workers skip the build call
+        markers = {mode: shared_dir / f"wg_image_{mode}.tag" for mode in DOCKER_IMAGES}
+        images = {mode: marker.read_text() for mode, marker in markers.items() if marker.exists()}
+        missing = [mode for mode in DOCKER_IMAGES if mode not in images]
+        if missing:
+            built = _build_images(docker_client, missing)
+            for mode, tag in built.items():
+                markers[mode].write_text(tag)
+            images.update(built)
+        return images
+
+def _build_images(docker_client, modes):
+    """Build the images for the given modes in parallel and return {mode: tag}."""
+    with ThreadPoolExecutor(max_workers=len(modes)) as executor:
+        futures = {mode: executor.submit(build_image, docker_client, mode) for mode in modes}
+        return {mode: future.result() for mode, future in futures.items()}
+
+# Records the commit the host install was made from. It sits inside the install dir,
+# so uninstall.sh removes it, and install.sh clears it on every run.
+INSTALL_MARKER = Path("/opt/wireguard-manager/.installed")
+
+def _clean_commit(backend_dir):
+    """Return the HEAD commit of the backend checkout.
+
+    None when the backend is not a clean git checkout, since the installed
+    copy could then differ from the working tree and install.sh must run.
+    """
+    try:
+        sha = subprocess.check_output(["git", "-C", backend_dir, "rev-parse", "HEAD"],
+                                      text=True, stderr=subprocess.DEVNULL).strip()
+        dirty = subprocess.check_output(["git", "-C", backend_dir, "status", "--porcelain", "--", "."], text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    if dirty.strip():
+        return None
+    return sha
+
+def _installed_commit():
+    """Return the commit recorded by the last test-driven install, if any."""
+    try:
+        return INSTALL_MARKER.read_text().strip()
+    except OSError:
+        return None
+
+def _build_run_kwargs(mode, container_name):
+    """Return the containers.run() keyword arguments for a docker test mode."""
     env = {}
     if mode == "standard":
         env = {
@@ -161,8 +200,12 @@ def docker_stack(request, docker_client):
     }
     
     if mode == "systemd":
+        in_ci = os.environ.get("GITHUB_ACTIONS", "false").lower() == "true"
+        debug = os.environ.get("WG_TEST_DEBUG", "false").lower() in ("1", "true")
+
         # Add systemd debugging environment variables
-        env["SYSTEMD_LOG_LEVEL"] = "debug"
+        if debug:
+            env["SYSTEMD_LOG_LEVEL"] = "debug"
         env["SYSTEMD_SHOW_STATUS"] = "true"
         env["SYSTEMD_IGNORE_CHROOT"] = "1"
         
@@ -179,19 +222,94 @@ def docker_stack(request, docker_client):
             '/run/lock': 'rw,nosuid,nodev,noexec,relatime,size=5m',
             '/tmp': 'rw,nosuid,nodev'
         }
-        kwargs["cgroupns_mode"] = "host"
         # Disable security restrictors which often block systemd PID 1 in GHA
-        kwargs["security_opt"] = ["seccomp=unconfined", "apparmor=unconfined"]
+        if in_ci:
+            kwargs["security_opt"] = ["seccomp=unconfined", "apparmor=unconfined"]
+
+
+    return kwargs
+
+@pytest.fixture(scope="session")
+def docker_stack(request, docker_client):
+    mode = request.param
+    base_url = "http://localhost:5000"
     
-    # Move cgroupns_mode to host_config if present
-    if "cgroupns_mode" in kwargs:
-        # cgroupns_mode should be in host_config, not main kwargs
-        host_config_kwargs = {}
-        # We'll need to manually handle this since the library doesn't recognize it
-        cgroupns_mode = kwargs.pop("cgroupns_mode")
-        # For now, let's try without it since it's not critical
-        pass
+    if mode == "host-systemd":
+        print(f"\nRunning in HOST SYSTEMD mode.")
+        backend_dir = os.path.join(os.path.dirname(__file__), "..")
+        install_script = os.path.join(backend_dir, "install.sh")
+        
+        sha = _clean_commit(backend_dir)
+        try:
+            if sha and _installed_commit() == sha:
+                print(f"Backend already installed from commit {sha}, skipping {install_script}")
+            else:
+                # Drop the marker first so a failed install is never taken as current
+                INSTALL_MARKER.unlink(missing_ok=True)
+                print(f"Running installation script: {install_script}")
+                subprocess.run(["bash", "-e", install_script], check=True, cwd=backend_dir)
+                if sha:
+                    INSTALL_MARKER.write_text(sha)
+                print("Installation complete.")
+            print("Restarting service...")
+            subprocess.run([ "systemctl", "restart", "wireguard-manager"], check=True)
+        except subprocess.CalledProcessError as e:
+            pytest.fail(f"Failed to setup host systemd: {e}")
+        
+        try:
+            wait_for_ready(base_url, mode)
+            yield base_url
+        finally:
+            print("Stopping host systemd service...")
+            subprocess.run([ "systemctl", "stop", "wireguard-manager"], check=True)
+        return
+
+    if mode == "host-standard":
+        print(f"\nRunning in HOST STANDARD mode.")
+        # Ensure systemd service is stopped to avoid port conflict
+        subprocess.run([ "systemctl", "stop", "wireguard-manager"], check=False)
+        
+        backend_dir = os.path.join(os.path.dirname(__file__), "..")
+        app_path = os.path.join(backend_dir, "app.py")
+        python_exe = sys.executable
+        
+        print(f"Starting backend: {python_exe} {app_path}")
+        process = subprocess.Popen([ python_exe, app_path], cwd=backend_dir)
+        
+        try:
+            wait_for_ready(base_url, mode)
+            yield base_url
+        finally:
+            print(f"Stopping host-standard backend (PID: {process.pid})...")
+            subprocess.run([ "kill", str(process.pid)])
+            process.wait()
+        return
+
+    # Docker modes
+    reuse = request.config.getoption("reuse_container")
+    if reuse:
+        container_name = f"wg-test-{mode}-dev"
+        container = _get_running_container(docker_client, container_name)
+        if container:
+            print(f"Reusing {mode} container {container_name}...")
+            port_bindings = docker_client.api.port(container.id, '5000/tcp')
+            base_url = f"http://{get_docker_host()}:{port_bindings[0]['HostPort']}"
+            try:
+                wait_for_ready(base_url, mode, container)
+            except BaseException:
+                # Don't keep an unhealthy container around for the next session
+                container.remove(force=True)
+                raise
+            yield base_url
+            return
+    else:
+        container_name = f"wg-test-{mode}-{uuid.uuid4().hex[:8]}"
+
+    image_tag = request.getfixturevalue("docker_images")[mode]
+    print(f"Starting {mode} container {container_name}...")
     
+    kwargs = _build_run_kwargs(mode, container_name)
+
     try:
         container = docker_client.containers.run(image_tag, **kwargs)
     except Exception as e:
@@ -199,46 +317,39 @@ def docker_stack(request, docker_client):
         print(f"Kwargs used: {kwargs}")
         raise
 
-    # Give systemd a bit more time to reach the socket-binding stage
-    time.sleep(5)
-    container.reload()
-    
-    # 5. Get assigned port
-    ports = container.attrs['NetworkSettings']['Ports']
-    if not ports or '5000/tcp' not in ports or not ports['5000/tcp']:
-        # Fallback/Retry reload if ports are missing (sometimes happens in slow CI)
-        time.sleep(2)
-        container.reload()
-        ports = container.attrs['NetworkSettings']['Ports']
+    # 5. Get assigned port (port lookup only, no full container inspect).
+    # Poll briefly in case the daemon publishes it late (sometimes happens in slow CI)
+    for _ in range(10):
+        port_bindings = docker_client.api.port(container.id, '5000/tcp')
+        if port_bindings:
+            break
+        time.sleep(0.3)
         
-    if not ports or '5000/tcp' not in ports or not ports['5000/tcp']:
+    if not port_bindings:
+        container.reload()
         state = container.attrs.get('State', {})
         status = state.get('Status', 'unknown')
         exit_code = state.get('ExitCode', 'N/A')
         error = state.get('Error', 'N/A')
         
-        try:
-            # Explicitly fetch both stdout and stderr
-            logs_raw = container.logs(stdout=True, stderr=True, tail=300)
-            logs = logs_raw.decode('utf-8', errors='replace')
-        except Exception as e:
-            logs = f"Failed to fetch logs: {e}"
-            
         container_info = (
             f"\n--- CONTAINER FAILURE INFO ---\n"
             f"Container: {container_name} ({mode})\n"
             f"Status: {status}\n"
             f"ExitCode: {exit_code}\n"
             f"Error: {error}\n"
-            f"--- CONTAINER LOGS (STDOUT+STDERR) ---\n"
-            f"{logs}\n"
-            f"---------------------------\n"
+            f"--- CONTAINER LOGS (STDOUT+STDERR) ---"
         )
         print(container_info)
+        try:
+            _print_container_logs(container)
+        except Exception as e:
+            print(f"Failed to fetch logs: {e}")
+        print("---------------------------\n")
         container.remove(force=True)
         pytest.fail(f"Could not get host port for {mode} container. See logs above.")
 
-    host_port = ports['5000/tcp'][0]['HostPort']
+    host_port = port_bindings[0]['HostPort']
     host = get_docker_host()
     base_url = f"http://{host}:{host_port}"
     
@@ -246,29 +357,77 @@ def docker_stack(request, docker_client):
         wait_for_ready(base_url, mode, container)
         yield base_url
     finally:
-        print(f"\nStopping container {container_name}...")
-        container.remove(force=True)
+        if reuse:
+            print(f"\nLeaving container {container_name} running for the next session")
+        else:
+            print(f"\nStopping container {container_name}...")
+            container.remove(force=True)
+
+def _get_running_container(docker_client, name):
+    """Return the named container if it is running; a stopped leftover is removed."""
+    try:
+        container = docker_client.containers.get(name)
+    except docker.errors.NotFound:
+        return None
+    if container.status == "running":
+        return container
+    container.remove(force=True)
+    return None
+
+def _print_container_logs(container):
+    """Print the tail of a container's stdout and stderr as the daemon streams it."""
+    # follow=False: stream=True would otherwise block on a running container
+    chunks = container.logs(stdout=True, stderr=True, tail=300, stream=True, follow=False)
+    # Incremental decoding keeps multi-byte characters split across chunks intact
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for chunk in chunks:
+        print(decoder.decode(chunk), end='', flush=True)
+    print(decoder.decode(b'', final=True))
+
+def _container_exited(container):
+    """Check if the container died while waiting."""
+    if not container:
+        return False
+    container.reload()
+    return container.attrs.get('State', {}).get('Status') == 'exited'
 
 def wait_for_ready(base_url, mode, container=None):
     print(f"Waiting for {mode} API to be ready at {base_url}...")
     start_time = time.time()
     ready = False
     timeout = 120 if "systemd" in mode else 45
+
+    parsed = urlparse(base_url)
+    address = (parsed.hostname, parsed.port)
+    # Back off exponentially between attempts: fast for a backend that is up in
+    # well under a second, without hammering a systemd container that takes longer
+    delay = 0.05
+
     while time.time() - start_time < timeout:
+        # Cheap TCP probe first, so a port that is not listening yet costs a
+        # refused connect rather than a full HTTP request timeout
+        try:
+            socket.create_connection(address, timeout=0.2).close()
+        except OSError:
+            if _container_exited(container):
+                break
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+            continue
+
         try:
-            response = requests.get(f"{base_url}/api/health", timeout=2)
+            response = _SESSION.get(f"{base_url}/api/health", timeout=(0.5, 2))
             if response.status_code == 200:
                 print("API is ready!")
                 ready = True
                 break
         except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-            # Check if container died while waiting
-            if container:
-                container.reload()
-                if container.attrs.get('State', {}).get('Status') == 'exited':
-                    break
-            time.sleep(2)
-    
+            # Docker's port proxy accepts TCP before the app listens
+            if _container_exited(container):
+                break
+        time.sleep(delay)
+        delay = min(delay * 1.5, 1.0)
+
     if not ready:
         if container:
             container.reload()
@@ -277,9 +436,9 @@ def wait_for_ready(base_url, mode, container=None):
             
             try:
                 # 1. Try standard logs
-                logs_raw = container.logs(stdout=True, stderr=True, tail=300)
-                logs = logs_raw.decode('utf-8', errors='replace')
-                print(f"\n--- API READINESS FAILURE LOGS ({mode}) ---\n{logs}\n--- END LOGS ---")
+                print(f"\n--- API READINESS FAILURE LOGS ({mode}) ---")
+                _print_container_logs(container)
+                print("--- END LOGS ---")
                 
                 # 2. If systemd, try journalctl (often has the real info)
                 if "systemd" in mode and current_status == "running":
@@ -307,14 +466,84 @@ def pytest_generate_tests(metafunc):
         else:
             metafunc.parametrize("docker_stack", ["standard", "systemd"], indirect=True)
 
+def pytest_sessionfinish(session, exitstatus):
+    _SESSION.close()
+
+def pytest_collection_modifyitems(config, items):
+    skip_host_scan = None
+    if os.environ.get("CI", "false").lower() == "true" and not os.environ.get("RUN_HOST_SCAN"):
+        skip_host_scan = pytest.mark.skip(reason="host IP scan skipped in CI; set RUN_HOST_SCAN=1 to run it")
+
+    # With `-n N --dist loadgroup`, keep each mode's tests on one xdist worker so
+    # that worker owns the mode's container and the modes start up in parallel
+    for item in items:
+        if skip_host_scan and "need_host_scan" in item.keywords:
+            item.add_marker(skip_host_scan)
+        callspec = getattr(item, "callspec", None)
+        if callspec and "docker_stack" in callspec.params:
+            item.add_marker(pytest.mark.xdist_group(callspec.params["docker_stack"]))
+
 @pytest.fixture(scope="session")
 def api_client(docker_stack):
-    return APIClient(docker_stack)
+    with APIClient(docker_stack, session=_SESSION) as client:
+        yield client
+
+_name_counter = itertools.count()
+
+def unique_suffix():
+    """Short name suffix, unique across xdist workers (pid) and within one (counter)."""
+    return f"{os.getpid():x}{next(_name_counter):04x}"
+
+@pytest.fixture
+def unique_name():
+    """Factory for interface/peer names that don't collide with other tests' leftovers.
+
+    Interface names are limited to 15 characters, so keep prefixes to a few letters.
+    """
+    def make(prefix):
+        return f"{prefix}{unique_suffix()}"
+    return make
+
+@pytest.fixture(scope="session")
+def shared_interface(api_client):
+    """Interface created once per backend and shared by tests.
+
+    Tests may add peers to it under their own names but must delete them again,
+    and must not change the interface itself; use fresh_interface for that.
+    """
+    name = f"wg{unique_suffix()}"
+    response = api_client.create_interface(name=name)
+    assert response.status_code == 201
+
+    yield name
+
+    api_client.delete_interface(name)
+
+@pytest.fixture(scope="session")
+def wg_available(api_client):
+    """Whether the backend can bring interfaces up, probed once with an empty interface."""
+    name = f"wg{unique_suffix()}"
+    response = api_client.create_interface(name=name)
+    assert response.status_code == 201
+    try:
+        return api_client.apply_config(name).status_code == 200
+    finally:
+        api_client.delete_interface(name)
 
 @pytest.fixture
-def test_interface(api_client):
-    """Fixture to create and clean up an interface for tests."""
-    name = f"wg{uuid.uuid4().hex[:4]}"
+def clean_interface(api_client, shared_interface):
+    """The shared interface, with any peers the test added removed afterwards."""
+    yield shared_interface
+
+    for peer in api_client.list_peers(shared_interface).json():
+        api_client.delete_peer(shared_interface, peer['name'])
+    # Rewrite the interface config too, so the next test starts from an empty file
+    api_client.sync_config(shared_interface)
+
+@pytest.fixture
+def fresh_interface(api_client):
+    """Fixture to create and clean up a disposable interface for a single test."""
+    name = f"wg{unique_suffix()}"
     response = api_client.create_interface(name=name)
     assert response.status_code == 201
     
@@ -323,7 +552,7 @@ def test_interface(api_client):
     # Cleanup
     api_client.delete_interface(name)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_dir():
     """Fixture to provide the WireGuard base directory for file-based tests."""
     return "/etc/wireguard"
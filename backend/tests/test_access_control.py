@@ -1,12 +1,20 @@
 import pytest
 import sys
 import os
-from unittest.mock import Mock
+from dataclasses import dataclass, field
 
 # Add backend to path to allow imports of services
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from services.access_control import AccessControl
+from services.access_control import AccessControl, _parse_ip
+
+
+@dataclass(slots=True)
+class FakeReq:
+    """Minimal stand-in for the Flask request attributes read by AccessControl."""
+    remote_addr: str
+    headers: dict = field(default_factory=dict)
+
 
 class TestAccessControl:
     
@@ -44,14 +52,22 @@ class TestAccessControl:
         # ::ffff:10.0.1.1 maps to 10.0.1.1 which is NOT in 10.0.0.0/24
         assert acl._ip_in_nets('::ffff:10.0.1.1', acl.allowed_ips) is False
 
+    def test_ip_in_nets_rejects_oversized_input(self):
+        """Oversized client-supplied strings are denied without entering the parse cache."""
+        acl = AccessControl(['10.0.0.1'], ['0.0.0.0/0'])
+        _parse_ip.cache_clear()
+
+        req = FakeReq('10.0.0.1', {'X-Forwarded-For': '1' * 8192})
+        allowed, _ = acl.is_allowed(req)
+        assert allowed is False
+        assert _parse_ip.cache_info().currsize == 1  # only the proxy address
+
     def test_is_allowed_no_proxies(self):
         """Test is_allowed logic when no proxies are configured."""
         acl = AccessControl([], ['10.0.0.0/24'])
         
         # Allowed IP
-        req = Mock()
-        req.remote_addr = '10.0.0.1'
-        req.headers = {}
+        req = FakeReq('10.0.0.1')
         allowed, reason = acl.is_allowed(req)
         assert allowed is True
         assert 'remote addr in allowed_ips' in reason
@@ -73,8 +89,7 @@ class TestAccessControl:
         acl = AccessControl(['10.0.0.1'], ['192.168.1.0/24'])
 
         # Request from untrusted source
-        req = Mock()
-        req.remote_addr = '1.2.3.4' # Not the proxy
+        req = FakeReq('1.2.3.4') # Not the proxy
         allowed, reason = acl.is_allowed(req)
         assert allowed is False
         assert 'did not come from trusted proxy' in reason
@@ -97,7 +112,6 @@ class TestAccessControl:
         """Test default allow all behavior."""
         # No allowed_ips -> allow all
         acl = AccessControl([], [])
-        req = Mock()
-        req.remote_addr = '1.2.3.4'
+        req = FakeReq('1.2.3.4')
         allowed, reason = acl.is_allowed(req)
         assert allowed is True
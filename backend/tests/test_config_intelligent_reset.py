@@ -1,31 +1,27 @@
 import pytest
-import docker
-import time
-import os
-from api_client import APIClient
 
-def test_intelligent_peer_correlation_on_reset(api_client, test_interface):
+def test_intelligent_peer_correlation_on_reset(api_client, clean_interface, unique_name):
     """
     Test that resetting the configuration (importing Flat -> Folder) 
     preserves peer names by correlating with the existing folder structure,
     even if the flat file lost the metadata.
     """
-    # 1. Create a peer with a specific name "MyPreciousPeer"
-    peer_name = "MyPreciousPeer"
-    # Use a specific IP within the default test_interface subnet (10.0.0.0/24)
+    # 1. Create a peer with a specific name "MyPreciousPeer..."
+    peer_name = unique_name("MyPreciousPeer")
+    # Use a specific IP within the default clean_interface subnet (10.0.0.0/24)
     # 10.0.0.50 should be safe
-    add_resp = api_client.add_peer(test_interface, name=peer_name, allowed_ips="10.0.0.50/32")
+    add_resp = api_client.add_peer(clean_interface, name=peer_name, allowed_ips="10.0.0.50/32")
     assert add_resp.status_code == 201
     peer_pub_key = add_resp.json()['public_key']
     
     # 2. Sync to generate .conf file
     # This takes the folder structure (with names) and writes to interface.conf
     # Based on our analysis, write_config likely drops the name comments for mpulti-peer files.
-    sync_resp = api_client.sync_config(test_interface)
+    sync_resp = api_client.sync_config(clean_interface)
     assert sync_resp.status_code == 200
     
     # 3. Verify the state before reset
-    peers_resp = api_client.list_peers(test_interface)
+    peers_resp = api_client.list_peers(clean_interface)
     peers = peers_resp.json()
     assert len(peers) == 1
     assert peers[0]['name'] == peer_name
@@ -34,11 +30,11 @@ def test_intelligent_peer_correlation_on_reset(api_client, test_interface):
     # This reads interface.conf (which lacks names) and recreates the folder structure.
     # Without the fix, this would rename the peer to "peer1".
     # With the fix, it should look up the existing folder, match the key/IP, and preserve "MyPreciousPeer".
-    reset_resp = api_client.reset_config(test_interface)
+    reset_resp = api_client.reset_config(clean_interface)
     assert reset_resp.status_code == 200
     
     # 5. List peers and verify the name is preserved
-    peers_resp = api_client.list_peers(test_interface)
+    peers_resp = api_client.list_peers(clean_interface)
     assert peers_resp.status_code == 200
     peers = peers_resp.json()
     
@@ -51,7 +47,7 @@ def test_intelligent_peer_correlation_on_reset(api_client, test_interface):
     assert current_peer['name'] == peer_name, f"Peer name lost! Expected '{peer_name}', got '{current_peer['name']}'"
     assert current_peer['public_key'] == peer_pub_key
 
-def test_intelligent_peer_correlation_by_ip(api_client, test_interface):
+def test_intelligent_peer_correlation_by_ip(api_client, fresh_interface):
     """
     Test peer preservation when Public Key changes but AllowedIPs match (e.g. peer re-keying),
     testing the secondary correlation logic.
@@ -59,10 +55,10 @@ def test_intelligent_peer_correlation_by_ip(api_client, test_interface):
     # 1. Create peer
     peer_name = "RekeyedPeer"
     ip = "10.200.0.10/32"
-    api_client.add_peer(test_interface, name=peer_name, allowed_ips=ip)
+    api_client.add_peer(fresh_interface, name=peer_name, allowed_ips=ip)
     
     # 2. Sync Config (Existing: KeyA, IP)
-    api_client.sync_config(test_interface)
+    api_client.sync_config(fresh_interface)
     
     # 3. Simulate an external change where Key changed but IP is same.
     # Since we can't easily edit the file in the container without docker client intricacies,
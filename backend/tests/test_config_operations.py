@@ -1,17 +1,15 @@
 import pytest
-import uuid
-import time
 
-def test_config_apply_diff_reset(api_client, test_interface):
+def test_config_apply_diff_reset(api_client, clean_interface, unique_name):
     """Test the flow of apply, diff, and reset for configuration."""
     
     # 1. Initially, diff might show some default stuff or be empty if just created
     # Since operations are now auto-synced, diff should be empty after adding a peer
-    peer_name = f"peer_{uuid.uuid4().hex[:4]}"
-    add_resp = api_client.add_peer(test_interface, name=peer_name)
+    peer_name = unique_name("peer_")
+    add_resp = api_client.add_peer(clean_interface, name=peer_name)
     public_key = add_resp.json()['public_key']
     
-    response = api_client.get_config_diff(test_interface)
+    response = api_client.get_config_diff(clean_interface)
     assert response.status_code == 200
     data = response.json()
     
@@ -24,12 +22,12 @@ def test_config_apply_diff_reset(api_client, test_interface):
     assert len(current_peers) == 0
 
     # 2. Sync config (generate file)
-    response = api_client.sync_config(test_interface)
+    response = api_client.sync_config(clean_interface)
     assert response.status_code == 200
     assert "Config synchronized successfully" in response.json()['message']
     
     # 3. Check diff again (now they should match)
-    response = api_client.get_config_diff(test_interface)
+    response = api_client.get_config_diff(clean_interface)
     assert response.status_code == 200
     data = response.json()
     
@@ -43,10 +41,10 @@ def test_config_apply_diff_reset(api_client, test_interface):
     # 4. Reset config
     # Since we are auto-synced, reset won't have much to do through the API,
     # but we can verify it returns success and maintains the sync.
-    response = api_client.reset_config(test_interface)
+    response = api_client.reset_config(clean_interface)
     assert response.status_code == 200
     
-    response = api_client.get_config_diff(test_interface)
+    response = api_client.get_config_diff(clean_interface)
     data = response.json()
     
     folder_peers = data['folder_config']['peers']
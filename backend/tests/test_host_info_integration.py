@@ -1,3 +1,5 @@
+# Tests marked need_host_scan make the backend rediscover host IPs, which can
+# query external services. They are skipped in CI unless RUN_HOST_SCAN is set.
 import pytest
 import os
 import json
@@ -11,7 +13,11 @@ def test_list_interfaces_structure(api_client):
     assert "ips" in response["host"]
 
 def test_host_info_manual_override(api_client):
-    """Test manual host info update and that it sets the manual flag."""
+    """Test manual host info update, that it sets the manual flag and that it persists.
+
+    In integration tests we can't easily restart the backend, so persistence in the
+    cache file is checked indirectly via GET.
+    """
     custom_ips = ["1.2.3.4", "5.6.7.8"]
     response = api_client.update_host_info(ips=custom_ips)
     assert response.status_code == 200
@@ -22,7 +28,9 @@ def test_host_info_manual_override(api_client):
     # Verify via list_interfaces
     interfaces = api_client.list_interfaces()
     assert interfaces["host"]["ips"] == custom_ips
+    assert interfaces["host"]["message"] is None or interfaces["host"]["message"] == "success"
 
+@pytest.mark.need_host_scan
 def test_host_info_rescan(api_client):
     """Test force rescan of host info."""
     # First set manual
@@ -35,17 +43,6 @@ def test_host_info_rescan(api_client):
     assert data["manual"] is False
     # IPs should be rediscovered (might be empty in CI/Docker but manual should be False)
 
-def test_host_info_file_persistence(api_client):
-    """Test that host info persists in the cache file (indirectly via GET)."""
-    custom_ips = ["9.9.9.9"]
-    api_client.update_host_info(ips=custom_ips)
-    
-    # In integration tests, we can't easily restart the backend, 
-    # but we can verify it returns what we just set.
-    interfaces = api_client.list_interfaces()
-    assert interfaces["host"]["ips"] == custom_ips
-    assert interfaces["host"]["message"] is None or interfaces["host"]["message"] == "success"
-
 def test_host_info_deduplication(api_client):
     """Test that the API deduplicates and cleans IPs."""
     input_ips = ["1.1.1.1", "1.1.1.1 ", "  2.2.2.2  ", "1.1.1.1"]
@@ -1,9 +1,8 @@
 import pytest
-import uuid
 
-def test_interface_lifecycle(api_client):
+def test_interface_lifecycle(api_client, unique_name):
     """Test full lifecycle of an interface: Create -> Get -> Update -> Delete"""
-    interface_name = f"wg{uuid.uuid4().hex[:4]}"
+    interface_name = unique_name("wg")
     
     # 1. Create
     response = api_client.create_interface(name=interface_name, address="10.10.10.1/24", listen_port="51821")
@@ -30,9 +29,9 @@ def test_interface_lifecycle(api_client):
     assert api_client.delete_interface(interface_name).status_code == 200
     assert api_client.get_interface(interface_name).status_code == 404
 
-def test_create_duplicate_interface(api_client, test_interface):
-    # test_interface fixture already created an interface with a random name
-    response = api_client.create_interface(name=test_interface)
+def test_create_duplicate_interface(api_client, shared_interface):
+    # shared_interface fixture already created an interface with a random name
+    response = api_client.create_interface(name=shared_interface)
     assert response.status_code == 400
 
 @pytest.mark.parametrize("invalid_name", [
@@ -65,16 +64,16 @@ def test_update_non_existent_interface(api_client):
     ("listen_port", "65536"),
     ("listen_port", "-1"),
 ])
-def test_update_invalid_fields(api_client, test_interface, field, invalid_value):
+def test_update_invalid_fields(api_client, shared_interface, field, invalid_value):
     kwargs = {field: invalid_value}
-    response = api_client.update_interface(test_interface, **kwargs)
+    response = api_client.update_interface(shared_interface, **kwargs)
     assert response.status_code == 400
 
-def test_create_invalid_fields(api_client):
+def test_create_invalid_fields(api_client, unique_name):
     # Invalid address
-    response = api_client.create_interface(name="wgvalid", address="invalid")
+    response = api_client.create_interface(name=unique_name("wg"), address="invalid")
     assert response.status_code == 400
     
     # Invalid port
-    response = api_client.create_interface(name="wgvalid2", listen_port="99999")
+    response = api_client.create_interface(name=unique_name("wg"), listen_port="99999")
     assert response.status_code == 400
@@ -1,15 +1,13 @@
 
 import pytest
-import json
-import re
 
-def test_private_key_redaction_in_diff(api_client, test_interface):
+def test_private_key_redaction_in_diff(api_client, clean_interface, unique_name):
     """Verify that private keys are redacted in config diff responses."""
     # 1. Add a peer to create some configuration
-    # Note: test_interface uses default 10.0.0.1/24, so peer should be in 10.0.0.x subnet
+    # Note: clean_interface uses default 10.0.0.1/24, so peer should be in 10.0.0.x subnet
     peer_response = api_client.add_peer(
-        test_interface,
-        name="test-peer",
+        clean_interface,
+        name=unique_name("test-peer-"),
         allowed_ips="10.0.0.2/32"
     )
     assert peer_response.status_code == 201, f"Failed to add peer: {peer_response.status_code} - {peer_response.text}"
@@ -22,7 +20,7 @@ def test_private_key_redaction_in_diff(api_client, test_interface):
     # If there's no private key generated, we can't test redaction
     if private_key:
         # 3. Get the config diff
-        diff_response = api_client.get_config_diff(test_interface)
+        diff_response = api_client.get_config_diff(clean_interface)
         assert diff_response.status_code == 200, f"Failed to get config diff: {diff_response.status_code} - {diff_response.text}"
         data = diff_response.json()
         
@@ -43,7 +41,7 @@ def test_private_key_redaction_in_diff(api_client, test_interface):
                 assert val != private_key
         
         # 5. Get the interface details which should have the interface private key
-        interface_response = api_client.get_interface(test_interface)
+        interface_response = api_client.get_interface(clean_interface)
         assert interface_response.status_code == 200, f"Failed to get interface: {interface_response.status_code} - {interface_response.text}"
         interface_data = interface_response.json()
         
@@ -52,13 +50,11 @@ def test_private_key_redaction_in_diff(api_client, test_interface):
         assert interface_data["public_key"] is not None
         
     # 6. List peers to verify private key handling in API responses
-    peers_response = api_client.list_peers(test_interface)
+    peers_response = api_client.list_peers(clean_interface)
     assert peers_response.status_code == 200, f"Failed to list peers: {peers_response.status_code} - {peers_response.text}"
     peers = peers_response.json()
     
-    # Peer private keys should either be null or redacted in list responses
-    for peer in peers:
-        if "private_key" in peer and peer["private_key"]:
-            # If shown, it should be for the peer's own config generation
-            # But it should never appear in diffs
-            pass
+    # Peer private keys may be shown here for the peer's own config generation,
+    # but they should never appear in diffs
+    if private_key:
+        assert not any(p.get("private_key") and p["private_key"] in diff_response.text for p in peers)
@@ -1,40 +1,38 @@
 import pytest
 
-def test_state_queries(api_client, test_interface):
+def test_state_queries(api_client, shared_interface):
     """Test state query and state diff."""
     
     # 1. Get State (equivalent to wg show)
-    response = api_client.get_state(test_interface)
+    response = api_client.get_state(shared_interface)
     assert response.status_code == 200
     state = response.json()
     assert "status" in state
     
     # 2. Get State Diff
-    response = api_client.get_state_diff(test_interface)
+    response = api_client.get_state_diff(shared_interface)
     assert response.status_code == 200
 
-def test_state_reflects_peer_addition(api_client, test_interface):
+def test_state_reflects_peer_addition(api_client, fresh_interface, unique_name, wg_available):
     """Test that adding a peer and applying config/state is reflected in wg show."""
+    if not wg_available:
+        pytest.skip("Backend cannot apply WireGuard config in this environment")
+
     # 1. Add a peer
-    peer_name = "state_test_peer"
-    add_resp = api_client.add_peer(test_interface, name=peer_name)
+    peer_name = unique_name("state_test_peer_")
+    add_resp = api_client.add_peer(fresh_interface, name=peer_name)
     assert add_resp.status_code == 201
     public_key = add_resp.json()['public_key']
     
     # 2. Apply config (This now does BOTH generation and application to live state)
-    apply_resp = api_client.apply_config(test_interface)
-    
-    # If it works (e.g. in systemd container with WG)
-    if apply_resp.status_code == 200:
-        # 3. Verify state reflects the peer
-        state_resp = api_client.get_state(test_interface)
-        if state_resp.status_code == 200:
-            state = state_resp.json()
-            assert any(p['public_key'] == public_key for p in state['peers'])
-        else:
-            pytest.skip(f"State query failed (likely env issue): {state_resp.text}")
-    else:
-        pytest.skip(f"Config apply failed (likely env issue): {apply_resp.text}")
+    apply_resp = api_client.apply_config(fresh_interface)
+    assert apply_resp.status_code == 200, apply_resp.text
+
+    # 3. Verify state reflects the peer
+    state_resp = api_client.get_state(fresh_interface)
+    assert state_resp.status_code == 200, state_resp.text
+    state = state_resp.json()
+    assert any(p['public_key'] == public_key for p in state['peers'])
 
 def test_state_non_existent_interface(api_client):
     # Now should return 200 with status="not_found"
@@ -17,12 +17,31 @@ from exceptions.wireguard_exceptions import CommandNotFoundException, Permission
 # Global configuration for sudo usage
 _AUTO_SUDO = True
 
+# The process never changes its effective uid, so check it once
+_IS_ROOT = os.geteuid() == 0
+
+# Commands that are run with sudo automatically; wg key generation needs no privileges
+_PRIVILEGED_CMDS = frozenset({'wg', 'wg-quick', 'systemctl'})
+_WG_UNPRIVILEGED_SUBCMDS = frozenset({'genkey', 'pubkey'})
+
+# Directories tried before falling back to a PATH search (trailing slash included)
+_COMMON_PATHS = ('/usr/bin/', '/usr/sbin/', '/bin/', '/sbin/')
+
+# Resolved command paths, keyed by command name (like the shell's `hash` table)
+_command_cache: dict[str, str] = {}
+
 
 def set_auto_sudo(enabled: bool) -> None:
     """Set whether to automatically use sudo for privileged commands."""
     global _AUTO_SUDO
     _AUTO_SUDO = enabled
 
+
+def invalidate_command_cache() -> None:
+    """Forget resolved command paths, e.g. after binaries were installed or moved."""
+    _command_cache.clear()
+
+
 def find_command(command: str) -> str:
     """
     Find the full path to a command.
@@ -36,19 +55,27 @@ def find_command(command: str) -> str:
     Raises:
         CommandNotFoundException: If command is not found
     """
+    cached = _command_cache.get(command)
+    if cached is not None:
+        return cached
+
+    path = _resolve_command(command)
+    if path is None:
+        raise CommandNotFoundException(command)
+
+    _command_cache[command] = path
+    return path
+
+
+def _resolve_command(command: str) -> Optional[str]:
     # Try common paths first
-    common_paths = ['/usr/bin', '/usr/sbin', '/bin', '/sbin']
-    for path in common_paths:
-        full_path = f"{path}/{command}"
-        if shutil.which(full_path):
+    for prefix in _COMMON_PATHS:
+        full_path = prefix + command
+        if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
             return full_path
     
     # Fallback to shutil.which
-    path = shutil.which(command)
-    if path:
-        return path
-    
-    raise CommandNotFoundException(command)
+    return shutil.which(command)
 
 
 def run_command(
@@ -77,26 +104,21 @@ def run_command(
         if command:
             # Auto-sudo for wg and wg-quick if not already present and not explicitly disabled
             # genkey and pubkey don't need sudo
-            privileged_cmds = ['wg', 'wg-quick', 'systemctl']
-            if command[0] in privileged_cmds and not use_sudo and _AUTO_SUDO:
-                if command[0] != 'wg' or (len(command) > 1 and command[1] not in ['genkey', 'pubkey']):
+            if command[0] in _PRIVILEGED_CMDS and not use_sudo and _AUTO_SUDO:
+                if command[0] != 'wg' or (len(command) > 1 and command[1] not in _WG_UNPRIVILEGED_SUBCMDS):
                     # Check if we are already root. If not, use sudo.
-                    if os.geteuid() != 0:
+                    if not _IS_ROOT:
                         use_sudo = True
             
-            if use_sudo and command[0] != 'sudo':
-                command = ['sudo'] + command
-            
-            # Resolve all command parts that look like binaries
-            # If it's ['sudo', 'wg', ...], we want to resolve 'sudo' and 'wg'
-            start_idx = 0
+            # Build the argv in one pass, resolving the binaries to full paths.
+            # If it's ['sudo', 'wg', ...], we want to resolve 'sudo' and 'wg'.
+            # The caller's list is never modified.
             if command[0] == 'sudo':
-                 # Resolve sudo itself
-                 command[0] = find_command('sudo')
-                 start_idx = 1
-            
-            if len(command) > start_idx:
-                command[start_idx] = find_command(command[start_idx])
+                command = [find_command('sudo'), *map(find_command, command[1:2]), *command[2:]]
+            elif use_sudo:
+                command = [find_command('sudo'), find_command(command[0]), *command[1:]]
+            else:
+                command = [find_command(command[0]), *command[1:]]
         
         try:
             result = subprocess.run(
@@ -129,6 +151,8 @@ def run_command(
             raise
         
     except FileNotFoundError:
+        # A cached path may point at a binary that has since moved; resolve again next time
+        invalidate_command_cache()
         # Capture command execution log for missing command
         if has_app_context() and hasattr(g, 'command_logs'):
             g.command_logs.append({
@@ -1,11 +1,31 @@
 """Logging utility for WireGuard Manager."""
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that only calls strftime once per second of record time."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (integer second, formatted time) of the last formatted record
+        self._cached_time = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, cached_str = self._cached_time
+        if second == cached_second:
+            return cached_str
+        formatted = super().formatTime(record, datefmt)
+        self._cached_time = (second, formatted)
+        return formatted
+
+
 def setup_logger(
     name: str = 'wireguard-manager',
     level: str = 'INFO',
@@ -31,6 +51,7 @@ def setup_logger(
     logger = logging.getLogger(name)
     
     # Clear existing handlers
+    _stop_queue_listener(logger)
     logger.handlers.clear()
     
     # Set logging level
@@ -38,7 +59,7 @@ def setup_logger(
     logger.setLevel(log_level)
     
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -60,7 +81,6 @@ def setup_logger(
         )
         main_handler.setFormatter(formatter)
         main_handler.setLevel(log_level)
-        logger.addHandler(main_handler)
         
         # Error log file - errors and above
         error_handler = RotatingFileHandler(
@@ -70,7 +90,13 @@ def setup_logger(
         )
         error_handler.setFormatter(formatter)
         error_handler.setLevel(logging.ERROR)
-        logger.addHandler(error_handler)
+        
+        # File writes happen on a background thread; callers only enqueue records
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, main_handler, error_handler, respect_handler_level=True)
+        listener.start()
+        logger._queue_listener = listener
+        logger.addHandler(QueueHandler(log_queue))
         
         logger.info(f"File logging initialized: {log_dir}")
     else:
@@ -85,6 +111,24 @@ def setup_logger(
     return logger
 
 
+def _stop_queue_listener(logger: logging.Logger) -> None:
+    """Flush and stop the background file writer of a logger, if it has one."""
+    listener = getattr(logger, '_queue_listener', None)
+    if listener is None:
+        return
+    logger._queue_listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_queue_listeners() -> None:
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(logger, logging.Logger):
+            _stop_queue_listener(logger)
+
+
 def get_logger(name: str = 'wireguard-manager') -> logging.Logger:
     """
     Get existing logger instance.
@@ -1,8 +1,14 @@
 import re
+import string
 import ipaddress
 from typing import Any
 from exceptions.wireguard_exceptions import ConfigurationException
 
+_IFNAME_FIRST_CHARS = frozenset(string.ascii_letters)
+_IFNAME_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+_HOSTNAME_RE = re.compile(r'\A[a-zA-Z0-9.-]+\Z')
+_PEER_NAME_RE = re.compile(r'\A[a-zA-Z0-9_.-]+\Z')
+
 def validate_interface_name(name: str):
     if not name:
         raise ConfigurationException("Interface name is required")
@@ -14,7 +20,7 @@ def validate_interface_name(name: str):
     # Must start with a letter and contain only alphanumeric characters, underscores, or dashes
     # Most Linux systems are strict about this. 
     # Let's enforce: start with letter, then alphanumeric/underscore/dash.
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', name):
+    if name[0] not in _IFNAME_FIRST_CHARS or not _IFNAME_CHARS.issuperset(name):
         raise ConfigurationException(
             f"Invalid interface name '{name}'. Must start with a letter and contain only alphanumeric characters, underscores, or dashes."
         )
@@ -58,15 +64,17 @@ def validate_endpoint(endpoint: str):
         return
 
     # Check for port at the end
-    if ':' not in endpoint:
+    address_part, sep, port_part = endpoint.rpartition(':')
+    if not sep:
         raise ConfigurationException(f"Invalid endpoint '{endpoint}'. Port is required (e.g., address:port).")
 
     # Handle IPv6 with brackets [addr]:port
     if endpoint.startswith('['):
-        if ']:' not in endpoint:
+        idx = endpoint.find(']:')
+        if idx < 0:
             raise ConfigurationException(f"Invalid IPv6 endpoint '{endpoint}'. Must be in [address]:port format.")
-        address_part = endpoint[1:endpoint.find(']:')]
-        port_part = endpoint[endpoint.find(']:')+2:]
+        address_part = endpoint[1:idx]
+        port_part = endpoint[idx+2:]
         
         try:
             ipaddress.IPv6Address(address_part)
@@ -75,10 +83,6 @@ def validate_endpoint(endpoint: str):
     else:
         # IPv4 or Hostname: address:port
         # Note: IPv6 without brackets is ambiguous if it contains multiple colons
-        parts = endpoint.rsplit(':', 1)
-        address_part = parts[0]
-        port_part = parts[1]
-
         # Basic hostname/IPv4 check
         if not address_part:
             raise ConfigurationException(f"Invalid endpoint '{endpoint}'. Address part is missing.")
@@ -92,7 +96,7 @@ def validate_endpoint(endpoint: str):
             ipaddress.ip_address(address_part)
         except ValueError:
             # Check if it looks like a valid hostname
-            if not re.match(r'^[a-zA-Z0-9.-]+$', address_part):
+            if not _HOSTNAME_RE.match(address_part):
                  raise ConfigurationException(f"Invalid address in endpoint: {address_part}")
 
     validate_port(port_part)
@@ -111,5 +115,5 @@ def validate_peer_name(name: str):
         raise ConfigurationException("Peer name must be at most 64 characters")
 
     # Allow letters, numbers, underscores, dashes, dots
-    if not re.match(r'^[a-zA-Z0-9_.-]+$', name):
+    if not _PEER_NAME_RE.match(name):
         raise ConfigurationException("Invalid peer name. Only letters, numbers, underscores, dashes and dots are allowed.")